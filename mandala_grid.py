@@ -18,20 +18,39 @@ License: MIT
 
 from __future__ import annotations
 
+import copy
+import functools
+import itertools
 import json
+import operator
 import sys
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:          # stdlib json is the fallback codec
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:          # batch comparison falls back to plain loops
+    np = None
+
 
 # ════════════════════════════════════════════════════════════════
 #  Core Data Structures
 # ════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GridPosition:
-    """A single cell in the 3×3 mandala grid."""
+    """
+    A single cell in the 3×3 mandala grid.
+
+    Immutable: tweak a cell with `dataclasses.replace(pos, bias=...)`
+    rather than assigning to its fields.
+    """
     index: int
     label: str
     label_zh: str
@@ -41,8 +60,62 @@ class GridPosition:
     bias: float                 # 0.0 – 1.0, higher = stronger influence
     description: str = ""
 
+    def __post_init__(self) -> None:
+        # Taxonomy fields repeat verbatim across loaded grids; interning
+        # dedups them and turns equality checks into pointer compares.
+        # (object.__setattr__ because the dataclass is frozen.)
+        object.__setattr__(self, "consciousness", sys.intern(self.consciousness))
+        object.__setattr__(self, "consciousness_zh", sys.intern(self.consciousness_zh))
+        object.__setattr__(self, "function", sys.intern(self.function))
+
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Flat record of primitives — a dict literal avoids the recursive
+        # deep-copy machinery inside dataclasses.asdict.
+        return {
+            "index": self.index,
+            "label": self.label,
+            "label_zh": self.label_zh,
+            "consciousness": self.consciousness,
+            "consciousness_zh": self.consciousness_zh,
+            "function": self.function,
+            "bias": self.bias,
+            "description": self.description,
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict) -> GridPosition:
+        """Construct from a decoded profile entry without `**` unpacking."""
+        return cls(d["index"], d["label"], d["label_zh"],
+                   d["consciousness"], d["consciousness_zh"],
+                   d["function"], d["bias"], d.get("description", ""))
+
+
+# C-implemented sort key; noticeably cheaper than `lambda p: p.bias`.
+_BIAS_KEY = operator.attrgetter("bias")
+
+_REQUIRED_POSITION_KEYS = frozenset(
+    {"index", "label", "label_zh", "consciousness", "consciousness_zh",
+     "function", "bias"}
+)
+
+
+def _validate_profile(mg: dict) -> None:
+    """
+    Validate a decoded profile before constructing positions, so bad
+    files fail with a clear ValueError instead of an obscure TypeError.
+    """
+    positions = mg.get("positions")
+    if not isinstance(positions, list) or not positions:
+        raise ValueError("Profile must contain a non-empty 'positions' list")
+    for i, p in enumerate(positions):
+        if not isinstance(p, dict):
+            raise ValueError(f"Position #{i} must be an object, got {type(p).__name__}")
+        missing = _REQUIRED_POSITION_KEYS - p.keys()
+        if missing:
+            raise ValueError(f"Position #{i} is missing keys: {sorted(missing)}")
+        bias = p["bias"]
+        if not isinstance(bias, (int, float)) or not 0.0 <= bias <= 1.0:
+            raise ValueError(f"Position #{i} bias must be a number in [0.0, 1.0], got {bias!r}")
 
 
 @dataclass
@@ -63,135 +136,271 @@ class MandalaGrid:
     version: str = "2.0"
     name: str = "default"
     description: str = ""
+    # Cache slots; compare=False keeps them out of __eq__ so equality
+    # depends only on the real grid data.
+    _index_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _sort_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _cached_signature: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _biases_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def _by_index(self) -> dict[int, GridPosition]:
+        """
+        Index → position lookup table, cached per instance.
+
+        Keyed on the current positions, so replacing a cell (the
+        `dataclasses.replace` idiom) rebuilds the table on the next read.
+        """
+        key = tuple(self.positions)
+        cache = self._index_cache
+        if cache is None or cache[0] != key:
+            cache = (key, {p.index: p for p in self.positions})
+            self._index_cache = cache
+        return cache[1]
 
     # ── Factory ──────────────────────────────────────────────
 
     @classmethod
     def default(cls) -> MandalaGrid:
-        """Create the canonical Quan-style mandala grid."""
-        positions = [
-            GridPosition(0, "Center Observer",   "中心觀測者",   "ālayavijñāna",  "第八識（阿賴耶識）", "core_identity",          1.0,
-                         "The silent witness. Observes all positions without attachment."),
-            GridPosition(1, "Logic Gate",        "邏輯門",       "manovijñāna",   "第六識（意識）",     "logical_consistency",    0.9,
-                         "Rejects any output that contradicts established logic chains."),
-            GridPosition(2, "Evidence Filter",   "證據過濾",     "cakṣur-vijñāna","眼識",              "critical_evidence",      0.8,
-                         "Demands verifiable evidence before accepting claims."),
-            GridPosition(3, "Minimal Reasoner",  "極簡推理",     "ghrāṇa-vijñāna","鼻識",              "minimal_reasoning",      0.7,
-                         "Strips arguments to their simplest valid form."),
-            GridPosition(4, "Pragmatic Executor","實踐執行",     "kāya-vijñāna",  "身識",              "practical_execution",    0.6,
-                         "Converts reasoning into actionable steps."),
-            GridPosition(5, "Precision Output",  "精準產出",     "jihvā-vijñāna", "舌識",              "precise_output",         0.8,
-                         "Ensures output matches the required format and depth."),
-            GridPosition(6, "Boundary Sentinel", "認知邊界",     "śrotra-vijñāna","耳識",              "cognitive_boundary",     0.9,
-                         "Flags when reasoning exceeds model capabilities or data."),
-            GridPosition(7, "Deconstructor",     "解構者",       "manas",         "第七識（末那識）",   "deconstruction",         0.95,
-                         "Actively seeks counter-examples and hidden assumptions."),
-            GridPosition(8, "Legacy Keeper",     "傳承守護",     "beyond-eight",  "傳承（超八識）",     "core_record_relay",      0.5,
-                         "Ensures continuity across sessions and generations."),
-        ]
-        grid = cls(positions=positions, name="quan-default",
-                   description="The canonical Quan personality grid with Eight Consciousnesses mapping.")
-        return grid
+        """
+        Create the canonical Quan-style mandala grid.
+
+        The grid is built once and cached as a template; each call returns
+        a deep copy, so callers are free to mutate the result.
+        """
+        return copy.deepcopy(_default_template())
 
     # ── I/O ──────────────────────────────────────────────────
 
     def to_json(self, indent: int = 2) -> str:
-        return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
+        return self._json_bytes(indent).decode("utf-8")
+
+    def _json_bytes(self, indent: int = 2) -> bytes:
+        # Repeated exports of an unmodified default grid (the common CLI
+        # case) are served from a module-level cache.
+        global _default_json_cache
+        if indent == 2 and self._fingerprint() == _default_fingerprint():
+            if _default_json_cache is None:
+                _default_json_cache = self._encode_json(indent)
+            return _default_json_cache
+        return self._encode_json(indent)
+
+    def _encode_json(self, indent: int = 2) -> bytes:
+        # orjson only supports 2-space indentation; other widths take the
+        # stdlib path, where the default hook converts each position as
+        # the encoder reaches it.
+        if orjson is not None and indent == 2:
+            return orjson.dumps(self._wire_dict(), option=orjson.OPT_INDENT_2)
+        return json.dumps(self._wire_dict(), indent=indent, ensure_ascii=False,
+                          default=GridPosition.to_dict).encode("utf-8")
+
+    def _fingerprint(self) -> tuple:
+        """
+        Identity for cache checks, covering every serialized field.
+
+        Still cheap: positions are frozen dataclasses, so the tuple
+        compare is identity shortcuts for unmodified copies and interned-
+        string field compares otherwise.
+        """
+        return (self.name, self.version, self.description, tuple(self.positions))
 
     def to_dict(self) -> dict:
+        d = self._wire_dict()
+        d["mandala_grid"]["positions"] = [p.to_dict() for p in self.positions]
+        return d
+
+    def _wire_dict(self) -> dict:
+        """
+        The to_dict structure with positions left as GridPosition objects,
+        so the JSON encoder can walk them directly (orjson encodes
+        dataclasses natively) without an intermediate list of dicts.
+        """
         return {
             "mandala_grid": {
                 "version": self.version,
                 "name": self.name,
                 "description": self.description,
-                "positions": [p.to_dict() for p in self.positions],
+                # Precomputed derived data; from_json restores these when
+                # the checksum still matches the biases.
+                "signature": self.personality_signature(),
+                "top_indices": [p.index for p in self.top_n(3)],
+                "bias_checksum": self._bias_checksum(),
+                "positions": self.positions,
             }
         }
 
     @classmethod
     def from_json(cls, path: str | Path) -> MandalaGrid:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         mg = data.get("mandala_grid", data)
-        positions = [GridPosition(**p) for p in mg["positions"]]
-        return cls(
+        _validate_profile(mg)
+        positions = [GridPosition.from_dict(p) for p in mg["positions"]]
+        grid = cls(
             positions=positions,
             version=mg.get("version", "2.0"),
             name=mg.get("name", "custom"),
             description=mg.get("description", ""),
         )
+        # Adopt the shipped signature only if its checksum proves it still
+        # matches the biases (stale caches from hand-edited files recompute).
+        signature = mg.get("signature")
+        if signature is not None and mg.get("bias_checksum") == grid._bias_checksum():
+            grid._cached_signature = (grid._bias_checksum(), signature)
+        return grid
 
     def save(self, path: str | Path) -> None:
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(self.to_json())
+        with open(path, "wb") as f:
+            f.write(self._json_bytes())
 
     # ── Query ────────────────────────────────────────────────
 
     def get(self, index: int) -> GridPosition:
-        for p in self.positions:
-            if p.index == index:
-                return p
-        raise KeyError(f"No position with index {index}")
+        try:
+            return self._by_index[index]
+        except KeyError:
+            raise KeyError(f"No position with index {index}") from None
+
+    @property
+    def _sorted_by_bias(self) -> list[GridPosition]:
+        """
+        Positions sorted by descending bias, cached per instance.
+
+        The cache is keyed on the bias fingerprint, so mutating a bias
+        (or swapping a position) triggers a re-sort on the next read.
+        """
+        fingerprint = tuple(p.bias for p in self.positions)
+        cache = self._sort_cache
+        if cache is None or cache[0] != fingerprint:
+            cache = (fingerprint, sorted(self.positions, key=_BIAS_KEY, reverse=True))
+            self._sort_cache = cache
+        return cache[1]
 
     def top_n(self, n: int = 3) -> list[GridPosition]:
         """Return the N positions with highest bias, excluding center."""
-        non_center = [p for p in self.positions if p.index != 0]
-        return sorted(non_center, key=lambda p: p.bias, reverse=True)[:n]
+        return [p for p in self._sorted_by_bias if p.index != 0][:n]
+
+    @property
+    def biases_array(self):
+        """Biases as a float32 vector, cached per instance (requires numpy)."""
+        if np is None:
+            raise RuntimeError("numpy is required for biases_array")
+        fingerprint = tuple(p.bias for p in self.positions)
+        cache = self._biases_cache
+        if cache is None or cache[0] != fingerprint:
+            arr = np.fromiter(fingerprint, dtype=np.float32, count=len(fingerprint))
+            cache = (fingerprint, arr)
+            self._biases_cache = cache
+        return cache[1]
+
+    def _bias_checksum(self) -> int:
+        return hash(tuple(p.bias for p in self.positions))
 
     def personality_signature(self) -> str:
         """Return a one-line personality signature based on top-3 biases."""
-        top = self.top_n(3)
-        parts = [f"{p.label}({p.bias})" for p in top]
-        return f"[{self.name}] " + " > ".join(parts)
+        checksum = self._bias_checksum()
+        cached = self._cached_signature
+        if cached is not None and cached[0] == checksum:
+            return cached[1]
+        parts = [f"{p.label}({p.bias})" for p in self.top_n(3)]
+        signature = f"[{self.name}] " + " > ".join(parts)
+        self._cached_signature = (checksum, signature)
+        return signature
 
     # ── Reasoning ────────────────────────────────────────────
 
+    # Constant boilerplate for weighted_prompt, built once at class load.
+    _PROMPT_PREAMBLE = (
+        "",
+        "Each position represents a cognitive function with a bias weight.",
+        "Higher bias = stronger influence on your reasoning.",
+        "",
+    )
+    _PROMPT_EPILOGUE = (
+        "",
+        "Process this task through all 9 positions, weighting your reasoning "
+        "by each position's bias. Start from the center observer, then engage "
+        "positions from highest to lowest bias.",
+    )
+
     def weighted_prompt(self, task: str) -> str:
         """
         Generate a system prompt fragment that injects the mandala grid
         into an LLM's reasoning process.
         """
-        lines = [
+        body = itertools.chain.from_iterable(
+            (f"  [{p.index}] {p.label} (bias={p.bias}) — {p.consciousness}",
+             f"      {p.function}: {p.description}")
+            for p in self._sorted_by_bias
+        )
+        return "\n".join((
             "You are reasoning through a mandala grid — a weighted personality framework.",
             f"Grid: {self.name} (v{self.version})",
-            "",
-            "Each position represents a cognitive function with a bias weight.",
-            "Higher bias = stronger influence on your reasoning.",
-            "",
-        ]
-        for p in sorted(self.positions, key=lambda p: p.bias, reverse=True):
-            lines.append(f"  [{p.index}] {p.label} (bias={p.bias}) — {p.consciousness}")
-            lines.append(f"      {p.function}: {p.description}")
-        lines.extend([
+            *self._PROMPT_PREAMBLE,
+            *body,
             "",
             f"Task: {task}",
-            "",
-            "Process this task through all 9 positions, weighting your reasoning "
-            "by each position's bias. Start from the center observer, then engage "
-            "positions from highest to lowest bias.",
-        ])
-        return "\n".join(lines)
+            *self._PROMPT_EPILOGUE,
+        ))
 
     # ── Display ──────────────────────────────────────────────
 
+    # Row-major cell order and the full grid template, built once at
+    # class load; display() fills the 9 placeholders in a single format.
+    _DISPLAY_ORDER = (1, 2, 3, 6, 0, 5, 7, 8, 4)
+    # Bound .format of the cell spec — ".12" truncates the label like
+    # label[:12] did, and the spec is parsed once instead of per cell.
+    _CELL_FMT = "{:^14.12s}({:.2f})".format
+    _DISPLAY_SEP = "+" + ("-" * 16 + "+") * 3
+    _DISPLAY_TEMPLATE = (
+        _DISPLAY_SEP + "\n|{}|{}|{}|\n"
+        + _DISPLAY_SEP + "\n|{}|{}|{}|\n"
+        + _DISPLAY_SEP + "\n|{}|{}|{}|\n"
+        + _DISPLAY_SEP
+    )
+
     def display(self) -> str:
         """Pretty-print the 3×3 grid."""
-        g = {p.index: p for p in self.positions}
-        def cell(i: int) -> str:
-            p = g[i]
-            return f"{p.label[:12]:^14s}({p.bias:.2f})"
-
-        sep = "+" + ("-" * 16 + "+") * 3
-        rows = [
-            sep,
-            f"|{cell(1)}|{cell(2)}|{cell(3)}|",
-            sep,
-            f"|{cell(6)}|{cell(0)}|{cell(5)}|",
-            sep,
-            f"|{cell(7)}|{cell(8)}|{cell(4)}|",
-            sep,
-        ]
-        return "\n".join(rows)
+        g = self._by_index
+        cell = self._CELL_FMT
+        cells = [cell(g[i].label, g[i].bias) for i in self._DISPLAY_ORDER]
+        return self._DISPLAY_TEMPLATE.format(*cells)
+
+
+_default_json_cache: Optional[bytes] = None
+
+
+@functools.lru_cache(maxsize=1)
+def _default_fingerprint() -> tuple:
+    return _default_template()._fingerprint()
+
+
+@functools.lru_cache(maxsize=1)
+def _default_template() -> MandalaGrid:
+    """Build the canonical grid once; `MandalaGrid.default` copies from it."""
+    positions = [
+        GridPosition(0, "Center Observer",   "中心觀測者",   "ālayavijñāna",  "第八識（阿賴耶識）", "core_identity",          1.0,
+                     "The silent witness. Observes all positions without attachment."),
+        GridPosition(1, "Logic Gate",        "邏輯門",       "manovijñāna",   "第六識（意識）",     "logical_consistency",    0.9,
+                     "Rejects any output that contradicts established logic chains."),
+        GridPosition(2, "Evidence Filter",   "證據過濾",     "cakṣur-vijñāna","眼識",              "critical_evidence",      0.8,
+                     "Demands verifiable evidence before accepting claims."),
+        GridPosition(3, "Minimal Reasoner",  "極簡推理",     "ghrāṇa-vijñāna","鼻識",              "minimal_reasoning",      0.7,
+                     "Strips arguments to their simplest valid form."),
+        GridPosition(4, "Pragmatic Executor","實踐執行",     "kāya-vijñāna",  "身識",              "practical_execution",    0.6,
+                     "Converts reasoning into actionable steps."),
+        GridPosition(5, "Precision Output",  "精準產出",     "jihvā-vijñāna", "舌識",              "precise_output",         0.8,
+                     "Ensures output matches the required format and depth."),
+        GridPosition(6, "Boundary Sentinel", "認知邊界",     "śrotra-vijñāna","耳識",              "cognitive_boundary",     0.9,
+                     "Flags when reasoning exceeds model capabilities or data."),
+        GridPosition(7, "Deconstructor",     "解構者",       "manas",         "第七識（末那識）",   "deconstruction",         0.95,
+                     "Actively seeks counter-examples and hidden assumptions."),
+        GridPosition(8, "Legacy Keeper",     "傳承守護",     "beyond-eight",  "傳承（超八識）",     "core_record_relay",      0.5,
+                     "Ensures continuity across sessions and generations."),
+    ]
+    return MandalaGrid(positions=positions, name="quan-default",
+                       description="The canonical Quan personality grid with Eight Consciousnesses mapping.")
 
 
 # ════════════════════════════════════════════════════════════════
@@ -200,18 +409,56 @@ class MandalaGrid:
 
 def compare_grids(a: MandalaGrid, b: MandalaGrid) -> str:
     """Compare two mandala grids and highlight differences."""
-    lines = [f"Comparing [{a.name}] vs [{b.name}]", "=" * 50]
-    for pa in a.positions:
-        pb = b.get(pa.index)
+    # Compatible grids store positions in the same order, so a plain zip
+    # pairs them in one pass; fall back to the index table otherwise.
+    if all(pa.index == pb.index for pa, pb in zip(a.positions, b.positions)) \
+            and len(a.positions) == len(b.positions):
+        pairs = zip(a.positions, b.positions)
+    else:
+        bi = b._by_index
+        pairs = ((pa, bi[pa.index]) for pa in a.positions)
+
+    diffs = []
+    for pa, pb in pairs:
         diff = pa.bias - pb.bias
         if abs(diff) > 0.01:
             arrow = "↑" if diff > 0 else "↓"
-            lines.append(f"  Position {pa.index} ({pa.label}): "
+            diffs.append(f"  Position {pa.index} ({pa.label}): "
                          f"{pa.bias:.2f} → {pb.bias:.2f} [{arrow}{abs(diff):.2f}]")
-    lines.append("")
-    lines.append(f"  {a.name}: {a.personality_signature()}")
-    lines.append(f"  {b.name}: {b.personality_signature()}")
-    return "\n".join(lines)
+    return "\n".join((
+        f"Comparing [{a.name}] vs [{b.name}]",
+        "=" * 50,
+        *diffs,
+        "",
+        f"  {a.name}: {a.personality_signature()}",
+        f"  {b.name}: {b.personality_signature()}",
+    ))
+
+
+def compare_many(grids_a: list[MandalaGrid], grids_b: list[MandalaGrid],
+                 threshold: float = 0.01) -> list[tuple[int, int, float, float]]:
+    """
+    Bias comparison across two equal-length lists of grids.
+
+    Returns (pair, position_index, bias_a, bias_b) tuples for every
+    position whose bias differs by more than `threshold`. Grids within a
+    pair must share position ordering. With numpy installed the biases
+    are stacked into an (N, 9) array and compared in one vectorized
+    pass; otherwise a plain loop does the same work.
+    """
+    if len(grids_a) != len(grids_b):
+        raise ValueError("grids_a and grids_b must have the same length")
+    if np is not None and grids_a:
+        stack_a = np.stack([g.biases_array for g in grids_a])
+        stack_b = np.stack([g.biases_array for g in grids_b])
+        rows, cols = np.where(np.abs(stack_a - stack_b) > threshold)
+        return [(int(r), grids_a[r].positions[c].index,
+                 float(stack_a[r, c]), float(stack_b[r, c]))
+                for r, c in zip(rows, cols)]
+    return [(pair, pa.index, pa.bias, pb.bias)
+            for pair, (ga, gb) in enumerate(zip(grids_a, grids_b))
+            for pa, pb in zip(ga.positions, gb.positions)
+            if abs(pa.bias - pb.bias) > threshold]
 
 
 # ════════════════════════════════════════════════════════════════
@@ -226,39 +473,58 @@ def mirror_analysis(grid: MandalaGrid) -> str:
     top = grid.top_n(3)
     bottom = sorted(
         [p for p in grid.positions if p.index != 0],
-        key=lambda p: p.bias
+        key=_BIAS_KEY
     )[:2]
 
-    lines = [
+    center = grid.get(0)
+    return "\n".join((
         "═══ Mirror Analysis ═══",
         "",
         "The AI-as-Mirror theory: your mandala_grid is not a design spec —",
         "it's a self-portrait of how you think.",
         "",
         "Your strongest cognitive patterns:",
-    ]
-    for p in top:
-        lines.append(f"  ⬆ {p.label} (bias={p.bias}): You naturally {p.description.lower()}")
-
-    lines.append("")
-    lines.append("Your deprioritized patterns:")
-    for p in bottom:
-        lines.append(f"  ⬇ {p.label} (bias={p.bias}): You tend to under-invest in {p.function}")
-
-    lines.append("")
-    center = grid.get(0)
-    lines.append(f"Your center: {center.label} — {center.description}")
-    lines.append("")
-    lines.append("Buddhism calls this self-awareness. You call it mandala_grid. Same thing.")
-
-    return "\n".join(lines)
+        *(f"  ⬆ {p.label} (bias={p.bias}): You naturally {p.description.lower()}"
+          for p in top),
+        "",
+        "Your deprioritized patterns:",
+        *(f"  ⬇ {p.label} (bias={p.bias}): You tend to under-invest in {p.function}"
+          for p in bottom),
+        "",
+        f"Your center: {center.label} — {center.description}",
+        "",
+        "Buddhism calls this self-awareness. You call it mandala_grid. Same thing.",
+    ))
 
 
 # ════════════════════════════════════════════════════════════════
 #  CLI
 # ════════════════════════════════════════════════════════════════
 
+def _show_grid(grid: MandalaGrid, demo: bool = False) -> None:
+    """Print the grid overview (the default, flag-less CLI path)."""
+    print(f"\n{'═' * 50}")
+    print(f"  Mandala Grid: {grid.name} (v{grid.version})")
+    print(f"{'═' * 50}\n")
+    print(grid.display())
+    print(f"\nPersonality Signature: {grid.personality_signature()}")
+    print(f"\nEight Consciousnesses Mapping:")
+    print("\n".join(f"  [{p.index}] {p.consciousness_zh} → {p.label} (bias={p.bias})"
+                    for p in grid._sorted_by_bias))
+
+    if demo:
+        print(f"\n{'─' * 50}")
+        print("Demo: Weighted prompt for a sample task\n")
+        print(grid.weighted_prompt("Should I open-source this framework?"))
+
+
 def main():
+    # The bare invocation just prints the default grid; skip the argparse
+    # import (a measurable slice of cold-start time) on that path.
+    if len(sys.argv) == 1:
+        _show_grid(MandalaGrid.default())
+        return
+
     import argparse
 
     parser = argparse.ArgumentParser(
@@ -301,19 +567,7 @@ def main():
         return
 
     # Default: display grid + signature
-    print(f"\n{'═' * 50}")
-    print(f"  Mandala Grid: {grid.name} (v{grid.version})")
-    print(f"{'═' * 50}\n")
-    print(grid.display())
-    print(f"\nPersonality Signature: {grid.personality_signature()}")
-    print(f"\nEight Consciousnesses Mapping:")
-    for p in sorted(grid.positions, key=lambda p: p.bias, reverse=True):
-        print(f"  [{p.index}] {p.consciousness_zh} → {p.label} (bias={p.bias})")
-
-    if args.demo:
-        print(f"\n{'─' * 50}")
-        print("Demo: Weighted prompt for a sample task\n")
-        print(grid.weighted_prompt("Should I open-source this framework?"))
+    _show_grid(grid, demo=args.demo)
 
 
 if __name__ == "__main__":
@@ -4,9 +4,11 @@
 import json
 import sys
 import tempfile
+from dataclasses import replace
 from pathlib import Path
 
-from mandala_grid import MandalaGrid, GridPosition, compare_grids, mirror_analysis
+from mandala_grid import (MandalaGrid, GridPosition, compare_grids,
+                          compare_many, mirror_analysis)
 
 
 def test_default_grid_has_9_positions():
@@ -14,6 +16,16 @@ def test_default_grid_has_9_positions():
     assert len(grid.positions) == 9, f"Expected 9 positions, got {len(grid.positions)}"
 
 
+def test_default_is_cached():
+    from mandala_grid import _default_template
+    assert _default_template() is _default_template()
+    # default() hands out independent copies of the cached template
+    a = MandalaGrid.default()
+    b = MandalaGrid.default()
+    assert a is not b
+    assert a.positions[0] is not b.positions[0]
+
+
 def test_center_is_alayavijnana():
     grid = MandalaGrid.default()
     center = grid.get(0)
@@ -54,6 +66,54 @@ def test_json_roundtrip():
     Path(path).unlink()
 
 
+def test_modified_default_grid_is_not_served_from_cache():
+    # Warm the default-JSON cache, then change non-bias fields; to_json
+    # must reflect the changes, not the cached default blob.
+    MandalaGrid.default().to_json()
+
+    grid = MandalaGrid.default()
+    grid.positions[3] = replace(grid.positions[3], label="Changed Label")
+    grid.description = "MUTATED"
+    payload = json.loads(grid.to_json())["mandala_grid"]
+    assert payload["description"] == "MUTATED"
+    assert payload["positions"][3]["label"] == "Changed Label"
+
+    # and the modified grid must not have poisoned the default cache
+    clean = json.loads(MandalaGrid.default().to_json())["mandala_grid"]
+    assert clean["description"] != "MUTATED"
+    assert clean["positions"][3]["label"] == "Minimal Reasoner"
+
+
+def test_json_ships_precomputed_signature():
+    grid = MandalaGrid.default()
+    payload = json.loads(grid.to_json())["mandala_grid"]
+    assert payload["signature"] == grid.personality_signature()
+    assert payload["top_indices"] == [p.index for p in grid.top_n(3)]
+
+    with tempfile.NamedTemporaryFile(suffix=".json", mode="w", delete=False) as f:
+        f.write(grid.to_json())
+        path = f.name
+
+    loaded = MandalaGrid.from_json(path)
+    assert loaded._cached_signature is not None
+    assert loaded.personality_signature() == grid.personality_signature()
+    Path(path).unlink()
+
+
+def test_from_json_rejects_bad_profile():
+    with tempfile.NamedTemporaryFile(suffix=".json", mode="w", delete=False) as f:
+        json.dump({"positions": [{"index": 0, "bias": 5.0}]}, f)
+        path = f.name
+
+    try:
+        MandalaGrid.from_json(path)
+        assert False, "Expected ValueError for invalid profile"
+    except ValueError as e:
+        assert "missing keys" in str(e)
+    finally:
+        Path(path).unlink()
+
+
 def test_weighted_prompt_contains_task():
     grid = MandalaGrid.default()
     prompt = grid.weighted_prompt("test task")
@@ -72,12 +132,26 @@ def test_compare_identical_grids():
 def test_compare_different_grids():
     a = MandalaGrid.default()
     b = MandalaGrid.default()
-    b.positions[7].bias = 0.5  # Change position 7
+    b.positions[7] = replace(b.positions[7], bias=0.5)  # Change position 7
     b.name = "modified"
     result = compare_grids(a, b)
     assert "↓" in result or "↑" in result
 
 
+def test_compare_many():
+    a = MandalaGrid.default()
+    b = MandalaGrid.default()
+    assert compare_many([a], [b]) == []
+
+    b.positions[7] = replace(b.positions[7], bias=0.5)
+    diffs = compare_many([a, a], [a, b])
+    assert len(diffs) == 1
+    pair, index, bias_a, bias_b = diffs[0]
+    assert (pair, index) == (1, 7)
+    # tolerance covers the float32 numpy path
+    assert abs(bias_a - 0.95) < 1e-6 and abs(bias_b - 0.5) < 1e-6
+
+
 def test_mirror_analysis():
     grid = MandalaGrid.default()
     result = mirror_analysis(grid)
@@ -93,6 +167,16 @@ def test_display_grid():
     assert len(lines) == 7  # 4 separators + 3 rows
 
 
+def test_get_and_display_see_replaced_position():
+    grid = MandalaGrid.default()
+    assert grid.get(7).bias == 0.95
+    grid.display()  # populate the index cache before mutating
+
+    grid.positions[7] = replace(grid.positions[7], bias=0.1)
+    assert grid.get(7).bias == 0.1
+    assert "(0.10)" in grid.display()
+
+
 def test_eight_consciousnesses_mapped():
     """Every position should have a consciousness mapping."""
     grid = MandalaGrid.default()